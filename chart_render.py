@@ -0,0 +1,29 @@
+"""
+chart_render.py — render chart PNGs in a separate process
+
+The GUI collects chart data on its scan thread and hands it over as plain
+jobs; matplotlib's import (~0.5 s) and per-figure rendering then happen in a
+spawned child process, so "Done" shows as soon as the report is written.
+
+Job format: (kind, title, labels, values, out_path) with kind "bar" or "pie".
+"""
+
+import multiprocessing
+
+from storage_utils import save_bar_chart, save_pie_chart
+
+
+def render_charts(jobs) -> None:
+    """Render every job in order (runs in the child process)."""
+    for kind, title, labels, values, out_path in jobs:
+        if kind == "bar":
+            save_bar_chart(title, labels, values, out_path, xlabel="GB")
+        else:
+            save_pie_chart(title, labels, values, out_path)
+
+
+def render_charts_async(jobs) -> multiprocessing.Process:
+    """Start render_charts(jobs) in a fresh 'spawn' process and return it (not joined)."""
+    proc = multiprocessing.get_context("spawn").Process(target=render_charts, args=(jobs,))
+    proc.start()
+    return proc
@@ -4,24 +4,40 @@ Adds:
   • Real progress % with ETA (per root & per-phase)
   • Double-click to open selected path in Finder
   • Right-click context menu: Reveal in Finder, Copy Path
+  • Roots scanned concurrently (one worker thread per root, up to 8)
+  • Scan menu: "Rescan (bypass cache)" re-lists every folder
 Defaults match your usual CLI run; Advanced is collapsible.
 
-Requires: storage_utils.py in same folder.
+Requires: storage_utils.py and chart_render.py in same folder.
 """
 
+import heapq
+import io
+import os
 import threading
 import time
 import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 from storage_utils import (
-    du_list, leaf_only, find_big_files, sample_files_for_types,
-    human_gb, accumulate_root_totals, filetype_totals,
-    save_bar_chart, save_pie_chart
+    cached_du_list, cached_scan_tree, leaf_only, find_big_files_iter, sample_files_for_types,
+    accumulate_root_totals, filetype_totals,
+    dedupe_roots, GIB, SCAN_ENGINES
 )
+from chart_render import render_charts_async
+
+# Optional: open paths through LaunchServices in-process (PyObjC) instead of forking 'open'
+try:
+    from Foundation import NSURL
+    from LaunchServices import LSOpenCFURLRef
+except ImportError:
+    LSOpenCFURLRef = None
 
 HOME = Path.home()
 DEFAULT_ROOTS = ["/Library", "/private", "/System", str(HOME), str(HOME / "Library")]
@@ -36,6 +52,7 @@ DEF_FILES = True
 DEF_MIN_FILE_GB = 1.0
 DEF_CHARTS = False
 DEF_FILETYPE_MIN_MB = 50
+DEF_ENGINE = "native"
 
 
 class ScannerGUI(tk.Tk):
@@ -55,12 +72,22 @@ class ScannerGUI(tk.Tk):
         # Enter key runs scan
         self.bind("<Return>", lambda e: self.on_run())
 
+        # Menu bar: Scan ▸ Run / Rescan without the folder-size cache
+        menubar = tk.Menu(self)
+        scan_menu = tk.Menu(menubar, tearoff=0)
+        scan_menu.add_command(label="Run Quick Scan", command=self.on_run)
+        scan_menu.add_command(label="Rescan (bypass cache)", command=self.on_rescan)
+        menubar.add_cascade(label="Scan", menu=scan_menu)
+        self.config(menu=menubar)
+
         # ===== Minimal essentials (defaults prefilled) =====
         essentials = ttk.Frame(self, padding=(10, 4, 10, 6))
         essentials.pack(fill="x")
 
         ttk.Label(essentials, text="Roots (comma-separated):").grid(row=0, column=0, sticky="w")
         self.roots_var = tk.StringVar(value=",".join(DEFAULT_ROOTS))
+        self._roots_list = list(DEFAULT_ROOTS)  # parsed roots_var, kept current by the trace below
+        self.roots_var.trace_add("write", self._on_roots_changed)
         ttk.Entry(essentials, textvariable=self.roots_var, width=90).grid(row=0, column=1, sticky="we", padx=(8, 0))
         ttk.Button(essentials, text="Add…", command=self.add_root).grid(row=0, column=2, padx=(8, 0))
 
@@ -75,7 +102,7 @@ class ScannerGUI(tk.Tk):
         # ===== Results table =====
         columns = ("size_gb", "path", "kind")
         self.tree = ttk.Treeview(self, columns=columns, show="headings", height=20)
-        self.tree.heading("size_gb", text="Size (GB)", command=lambda: self.sort_by("size_gb", num=True))
+        self.tree.heading("size_gb", text="Size (GB)", command=lambda: self.sort_by("size_gb"))
         self.tree.heading("path", text="Path", command=lambda: self.sort_by("path"))
         self.tree.heading("kind", text="Type", command=lambda: self.sort_by("kind"))
         self.tree.column("size_gb", width=110, anchor="e")
@@ -121,6 +148,10 @@ class ScannerGUI(tk.Tk):
         self.min_gb_var = tk.DoubleVar(value=DEF_MIN_GB)
         ttk.Spinbox(self.adv, from_=0.1, to=1000.0, increment=0.1, textvariable=self.min_gb_var, width=8).grid(row=r, column=5, sticky="w", padx=(8, 16))
 
+        ttk.Label(self.adv, text="Engine:").grid(row=r, column=6, sticky="w")
+        self.engine_var = tk.StringVar(value=DEF_ENGINE)
+        ttk.Combobox(self.adv, values=SCAN_ENGINES, textvariable=self.engine_var, state="readonly", width=8).grid(row=r, column=7, sticky="w", padx=(8, 0))
+
         r += 1
         self.leaf_only_var = tk.BooleanVar(value=DEF_LEAF_ONLY)
         self.files_var = tk.BooleanVar(value=DEF_FILES)
@@ -139,9 +170,25 @@ class ScannerGUI(tk.Tk):
 
         # Thread + progress accounting
         self._scan_thread = None
+        self._scan_running = threading.Event()  # set while a scan is in flight
+        self._scan_gen = 0  # bumped per launch; report writers of older scans stay quiet
+        self._report_lock = threading.Lock()  # one report writer at a time
+        self._report_gen = 0  # scan whose report was written last (guarded by _report_lock)
         self._start_time = None
+        self._last_tick = None
+        self._ewma_rate = None  # smoothed steps/sec, drives the ETA
         self._total_steps = 0
         self._done_steps = 0
+        self._progress_lock = threading.Lock()  # roots report progress from worker threads
+        self._progress_pending = False  # a _flush_progress is already posted
+
+        # Result rows queued by workers, inserted in batches by the _flush_rows pump
+        self._pending_rows = []
+        self._pending_removals = []  # (path, kind) of rows to take back out
+        self._pending_lock = threading.Lock()
+        self._flush_job = None
+        self._rows = []  # (size_bytes, path, kind, iid, path.lower()) per inserted row, used by sort_by
+        self._last_sort = None
 
         # mac-ish look
         try:
@@ -176,7 +223,9 @@ class ScannerGUI(tk.Tk):
         if not path:
             return
         try:
-            # 'open' reveals file or folder in Finder (for files: opens; for dirs: opens)
+            # LaunchServices opens the file or folder directly; 'open' does the same via fork+exec
+            if LSOpenCFURLRef is not None and LSOpenCFURLRef(NSURL.fileURLWithPath_(path), None)[0] == 0:
+                return
             subprocess.run(["open", path], check=False)
         except Exception as e:
             messagebox.showerror("Open in Finder", f"Could not open:\n{path}\n\n{e}")
@@ -197,20 +246,21 @@ class ScannerGUI(tk.Tk):
             return
 
         try:
-            depth = int(getattr(self, "depth_var", tk.IntVar(value=DEF_DEPTH)).get())
-            min_gb = float(getattr(self, "min_gb_var", tk.DoubleVar(value=DEF_MIN_GB)).get())
-            topn = int(getattr(self, "top_var", tk.IntVar(value=DEF_TOP)).get())
-            leaf = bool(getattr(self, "leaf_only_var", tk.BooleanVar(value=DEF_LEAF_ONLY)).get())
-            include_files = bool(getattr(self, "files_var", tk.BooleanVar(value=DEF_FILES)).get())
-            charts = bool(getattr(self, "charts_var", tk.BooleanVar(value=DEF_CHARTS)).get())
-            min_file_gb = float(getattr(self, "min_file_gb_var", tk.DoubleVar(value=DEF_MIN_FILE_GB)).get())
-            filetype_min_mb = int(getattr(self, "filetype_min_mb_var", tk.IntVar(value=DEF_FILETYPE_MIN_MB)).get())
+            depth = self.depth_var.get()
+            min_gb = self.min_gb_var.get()
+            topn = self.top_var.get()
+            leaf = self.leaf_only_var.get()
+            include_files = self.files_var.get()
+            charts = self.charts_var.get()
+            min_file_gb = self.min_file_gb_var.get()
+            filetype_min_mb = self.filetype_min_mb_var.get()
+            engine = self.engine_var.get()
         except Exception as e:
             messagebox.showerror("Error", f"Invalid settings: {e}")
             return
 
         # Launch scan using ONLY the selected path as root
-        self._launch_scan([path], depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb)
+        self._launch_scan([path], depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb, engine, True)
 
     # ---------- UI helpers ----------
     def toggle_advanced(self):
@@ -223,11 +273,13 @@ class ScannerGUI(tk.Tk):
             self.adv_btn.configure(text="Hide Advanced ▾")
             self.adv_visible = True
 
+    def _on_roots_changed(self, *_):
+        self._roots_list = [p.strip() for p in self.roots_var.get().split(",") if p.strip()]
+
     def add_root(self):
         sel = filedialog.askdirectory(title="Select root folder to scan")
         if sel:
-            s = self.roots_var.get().strip()
-            parts = [p.strip() for p in s.split(",") if p.strip()] if s else []
+            parts = list(self._roots_list)
             if sel not in parts:
                 parts.append(sel)
             self.roots_var.set(",".join(parts))
@@ -237,47 +289,57 @@ class ScannerGUI(tk.Tk):
         self.config(cursor="watch" if busy else "")
         self.update_idletasks()
 
-    def sort_by(self, col, num=False):
-        items = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-        if num:
-            items.sort(key=lambda x: float(x[0]))
-        else:
-            items.sort(key=lambda x: x[0].lower())
-        if hasattr(self, "_last_sort") and self._last_sort == col:
-            items.reverse()
-            self._last_sort = None
-        else:
-            self._last_sort = col
-        for idx, (_, iid) in enumerate(items):
-            self.tree.move(iid, "", idx)
+    def sort_by(self, col):
+        """Sort from the Python-side self._rows (no tree.set read-back per row); click again to reverse."""
+        keys = {
+            "size_gb": itemgetter(0),
+            "path": itemgetter(4),  # path.lower(), computed once at insert
+            "kind": itemgetter(2),
+        }
+        reverse = self._last_sort == col
+        self._rows.sort(key=keys[col], reverse=reverse)
+        self._last_sort = None if reverse else col
+        self.tree.set_children("", *[row[3] for row in self._rows])  # one Tk call, not a move() per row
 
     # ---------- Progress helpers ----------
     def _progress_reset(self, total_steps):
         self._total_steps = max(1, int(total_steps))
         self._done_steps = 0
-        self._start_time = time.time()
-        self._update_progress_label()
+        self._start_time = self._last_tick = time.time()
+        self._ewma_rate = None
+        self._schedule_progress()
 
     def _progress_step(self, steps=1):
-        self._done_steps += steps
-        if self._done_steps > self._total_steps:
-            self._done_steps = self._total_steps
-        pct = int((self._done_steps / self._total_steps) * 100)
-        self.after(0, lambda: self.progress.configure(maximum=100, value=pct))
-        self._update_progress_label()
-
-    def _update_progress_label(self):
-        # ETA based on average pace so far
-        now = time.time()
-        elapsed = max(0.001, now - (self._start_time or now))
-        ratio = self._done_steps / max(1, self._total_steps)
-        if ratio > 0:
-            remaining = elapsed * (1 - ratio) / ratio
-        else:
-            remaining = 0
-        eta_str = self._fmt_seconds(remaining)
-        pct = int((self._done_steps / max(1, self._total_steps)) * 100)
-        self.after(0, lambda: self.progress_label.configure(text=f"{pct}% • ETA {eta_str}"))
+        with self._progress_lock:
+            self._done_steps += steps
+            if self._done_steps > self._total_steps:
+                self._done_steps = self._total_steps
+            if steps:
+                # exponentially smoothed pace (alpha 0.3): phases differ a lot in cost,
+                # so the run-wide average would swing the ETA around
+                now = time.time()
+                rate = steps / max(0.001, now - self._last_tick)
+                self._ewma_rate = rate if self._ewma_rate is None else 0.3 * rate + 0.7 * self._ewma_rate
+                self._last_tick = now
+        self._schedule_progress()
+
+    def _schedule_progress(self):
+        """Post one _flush_progress for any number of steps landing within 50 ms."""
+        with self._progress_lock:
+            if self._progress_pending:
+                return
+            self._progress_pending = True
+        self.after(50, self._flush_progress)
+
+    def _flush_progress(self):
+        """Main thread: draw bar and label from the latest progress state."""
+        with self._progress_lock:
+            self._progress_pending = False
+            done, total, rate = self._done_steps, self._total_steps, self._ewma_rate
+        pct = int((done / max(1, total)) * 100)
+        eta_str = self._fmt_seconds((total - done) / rate) if rate else "—:—"  # —:— until a step finishes
+        self.progress["value"] = pct
+        self.progress_label["text"] = f"{pct}% • ETA {eta_str}"
 
     @staticmethod
     def _fmt_seconds(s):
@@ -290,156 +352,325 @@ class ScannerGUI(tk.Tk):
         """Plan total steps for %/ETA: (du + files? + sample?) × roots."""
         return num_roots * (1 + (1 if include_files else 0) + (1 if charts else 0))
 
-    def _launch_scan(self, roots, depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb):
+    def _launch_scan(self, roots, depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb, engine, use_cache):
         """Common launcher used by on_run and on_scan_selected_only."""
+        if self._scan_running.is_set():
+            return
+        self._scan_running.set()
+        self._scan_gen += 1
+
         # reset UI
         self.tree.delete(*self.tree.get_children())
+        self._rows = []
+        self._last_sort = None
         self.status.configure(text="Scanning…")
         self.set_busy(True)
 
         total_steps = self._compute_total_steps(len(roots), include_files, charts)
         self._progress_reset(total_steps)
 
-        args = (roots, depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb)
+        args = (roots, depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb, engine, use_cache)
         self._scan_thread = threading.Thread(target=self._run_scan, args=args, daemon=True)
         self._scan_thread.start()
-        self.after(200, self._poll_thread)
+        self._start_row_pump()
+
     # ---------- Scan orchestration ----------
-    def on_run(self):
-        if self._scan_thread and self._scan_thread.is_alive():
+    def on_run(self, use_cache=True):
+        if self._scan_running.is_set():
             return
         try:
-            roots = [p.strip() for p in self.roots_var.get().split(",") if p.strip()]
+            roots, dropped = dedupe_roots(self._roots_list)
             if not roots:
                 messagebox.showerror("Error", "Please specify at least one root directory.")
                 return
 
-            depth = int(getattr(self, "depth_var", tk.IntVar(value=DEF_DEPTH)).get())
-            min_gb = float(getattr(self, "min_gb_var", tk.DoubleVar(value=DEF_MIN_GB)).get())
-            topn = int(getattr(self, "top_var", tk.IntVar(value=DEF_TOP)).get())
-            leaf = bool(getattr(self, "leaf_only_var", tk.BooleanVar(value=DEF_LEAF_ONLY)).get())
-            include_files = bool(getattr(self, "files_var", tk.BooleanVar(value=DEF_FILES)).get())
-            charts = bool(getattr(self, "charts_var", tk.BooleanVar(value=DEF_CHARTS)).get())
-            min_file_gb = float(getattr(self, "min_file_gb_var", tk.DoubleVar(value=DEF_MIN_FILE_GB)).get())
-            filetype_min_mb = int(getattr(self, "filetype_min_mb_var", tk.IntVar(value=DEF_FILETYPE_MIN_MB)).get())
+            depth = self.depth_var.get()
+            min_gb = self.min_gb_var.get()
+            topn = self.top_var.get()
+            leaf = self.leaf_only_var.get()
+            include_files = self.files_var.get()
+            charts = self.charts_var.get()
+            min_file_gb = self.min_file_gb_var.get()
+            filetype_min_mb = self.filetype_min_mb_var.get()
+            engine = self.engine_var.get()
         except Exception as e:
             messagebox.showerror("Error", f"Invalid settings: {e}")
             return
 
-        self._launch_scan(roots, depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb)
-
-    def _poll_thread(self):
-        if self._scan_thread and self._scan_thread.is_alive():
-            self.after(250, self._poll_thread)
+        self._launch_scan(roots, depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb, engine, use_cache)
+        if dropped:
+            self.status.configure(text=f"Scanning… (skipping roots already covered: {', '.join(dropped)})")
+
+    def on_rescan(self):
+        """Menu action: scan again, re-listing every folder instead of trusting cached sizes."""
+        self.on_run(use_cache=False)
+
+    def _scan_done(self):
+        """Main-thread completion callback, posted once by the scan worker."""
+        self._stop_row_pump()
+        self.set_busy(False)
+        self._scan_running.clear()
+
+    def _scan_one_root(self, root, depth, min_gb_bytes, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb, engine, use_cache):
+        """Worker: scan a single root (du + files? + sample?) and return its results for merging."""
+        buf = io.StringIO()  # this root's report section
+        buf.write(f"\n### Root: {root}\n")
+        folders = []
+        files = []
+        ext_totals = {}
+
+        # rows stream into the table as big files are discovered; evicted ones are taken back out
+        top_files = {}  # path -> size_bytes of the running top-N
+
+        def on_file(size_bytes, path, evicted):
+            top_files[path] = size_bytes
+            self.tree_insert_safe(size_bytes, path, "file")
+            if evicted:
+                del top_files[evicted[1]]
+                self.tree_remove_safe(evicted[1], "file")
+
+        # === Phase 1: directories (du) — the native engine also collects big files and
+        # file-type totals in the same walk ===
+        fused = (include_files or charts) and engine == "native"
+        if fused:
+            # Rescan bypasses the cached result but still rewrites it for the next Run
+            raw_pairs, big_files, ext_totals = cached_scan_tree(
+                root, depth, int(min_file_gb * GIB) if include_files else None, topn, on_file,
+                filetype_min_mb * 1024 * 1024 if charts else None, refresh=not use_cache,
+            )
         else:
-            self.set_busy(False)
+            raw_pairs = cached_du_list(root, depth, engine, refresh=not use_cache)
+
+        # filter + leaf-only + top
+        kept = (p for p in raw_pairs if p[0] >= min_gb_bytes)
+        if leaf:
+            kept = leaf_only(list(kept))
+        pairs = heapq.nlargest(topn, kept, key=lambda x: x[0])
 
-    def _run_scan(self, roots, depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb):
+        if not pairs:
+            buf.write("  (no folders above threshold)\n")
+        else:
+            buf.write("  Top folders:\n")
+            for size_bytes, path in pairs:
+                gb = size_bytes / GIB
+                folders.append((size_bytes, path))
+                buf.write("%6.2fG\t%s\n" % (gb, path))
+                self.tree_insert_safe(size_bytes, path, "folder")
+
+        self._progress_step(1)  # done phase
+
+        # === Phase 2: files (optional) ===
+        if include_files:
+            if fused:
+                for size_bytes, path in big_files:
+                    if path not in top_files:  # cache hit: nothing was streamed
+                        self.tree_insert_safe(size_bytes, path, "file")
+            else:
+                for size_bytes, path, evicted in find_big_files_iter(root, min_file_gb, topn):
+                    on_file(size_bytes, path, evicted)
+                big_files = sorted(((s, p) for p, s in top_files.items()), reverse=True)
+            if big_files:
+                buf.write("  Top files:\n")
+                for size_bytes, path in big_files:
+                    gb = size_bytes / GIB
+                    files.append((size_bytes, path))
+                    buf.write("%6.2fG\t%s\n" % (gb, path))
+            else:
+                buf.write("  (no files above threshold)\n")
+            self._progress_step(1)
+
+        # === Phase 3: sampling for charts (optional) ===
+        if charts:
+            if not fused:
+                # sampled files are folded into per-extension totals as find streams them
+                ext_totals = filetype_totals(sample_files_for_types(root, filetype_min_mb))
+            self._progress_step(1)
+
+        # raw rows are only needed for the by-root pie chart; don't keep them alive otherwise
+        return {"pairs": raw_pairs if charts else None, "folders": folders, "files": files, "ext_totals": ext_totals, "report": buf.getvalue()}
+
+    def _run_scan(self, roots, depth, min_gb, topn, leaf, include_files, charts, min_file_gb, filetype_min_mb, engine, use_cache):
         ts = datetime.now().strftime("%Y-%m-%d %H:%M")
         report_path = REPORT_PATH
-        lines = [
-            f"=== macOS Deep Storage Report — {ts} ===",
-            f"Roots: {', '.join(roots)}",
-            f"Depth: {depth} | Leaf-only: {leaf} | MinGB: {min_gb} | Top: {topn}",
-            f"Files: {'enabled' if include_files else 'disabled'} | MinFileGB: {min_file_gb}",
-            f"Charts: {'enabled' if charts else 'disabled'} | FileTypeMinMB: {filetype_min_mb}",
-            ""
-        ]
+        buf = io.StringIO()
+        buf.write(f"=== macOS Deep Storage Report — {ts} ===\n")
+        buf.write(f"Roots: {', '.join(roots)}\n")
+        buf.write(f"Depth: {depth} | Leaf-only: {leaf} | MinGB: {min_gb} | Top: {topn}\n")
+        buf.write(f"Files: {'enabled' if include_files else 'disabled'} | MinFileGB: {min_file_gb}\n")
+        buf.write(f"Charts: {'enabled' if charts else 'disabled'} | FileTypeMinMB: {filetype_min_mb}\n\n")
+
+        min_gb_bytes = int(min_gb * GIB)  # filter on ints, no per-pair float conversion
 
         per_root_pairs = {}
         all_top_folders = []
         all_top_files = []
-        sampled_for_types = []
+        ext_counter = Counter()  # extension -> bytes, summed across roots
 
         try:
+            # Roots are I/O bound (scandir/stat release the GIL): scan them concurrently,
+            # then merge results on this thread in the order the roots were given.
+            results = {}
+            with ThreadPoolExecutor(max_workers=min(8, len(roots))) as pool:
+                futures = {
+                    pool.submit(self._scan_one_root, root, depth, min_gb_bytes, topn, leaf,
+                                include_files, charts, min_file_gb, filetype_min_mb, engine, use_cache): root
+                    for root in roots
+                }
+                for fut in as_completed(futures):
+                    root = futures[fut]
+                    try:
+                        results[root] = fut.result()
+                    except Exception as e:
+                        # one failed root must not throw away the roots that finished
+                        results[root] = {"pairs": [] if charts else None, "folders": [], "files": [], "ext_totals": {},
+                                         "report": f"\n### Root: {root}\n  (scan failed: {e})\n"}
+
             for root in roots:
-                # === Phase 1: directories (du) ===
-                lines.append(f"\n### Root: {root}")
-                pairs = du_list(root, depth)
-                per_root_pairs[root] = pairs[:]
-
-                # filter + leaf-only + top
-                pairs = [p for p in pairs if human_gb(p[0]) >= min_gb]
-                if leaf:
-                    pairs = leaf_only(pairs)
-                pairs = sorted(pairs, key=lambda x: x[0], reverse=True)[:topn]
-
-                if not pairs:
-                    lines.append("  (no folders above threshold)")
-                else:
-                    lines.append("  Top folders:")
-                    for size_bytes, path in pairs:
-                        gb = human_gb(size_bytes)
-                        all_top_folders.append((size_bytes, path))
-                        lines.append(f"{gb:6.2f}G\t{path}")
-                        self.tree_insert_safe(f"{gb:6.2f}", path, "folder")
-
-                self._progress_step(1)  # done phase
-
-                # === Phase 2: files (optional) ===
-                if include_files:
-                    big_files = find_big_files(root, min_file_gb, topn)
-                    if big_files:
-                        lines.append("  Top files:")
-                        for size_bytes, path in big_files:
-                            gb = human_gb(size_bytes)
-                            all_top_files.append((size_bytes, path))
-                            lines.append(f"{gb:6.2f}G\t{path}")
-                            self.tree_insert_safe(f"{gb:6.2f}", path, "file")
-                    else:
-                        lines.append("  (no files above threshold)")
-                    self._progress_step(1)
-
-                # === Phase 3: sampling for charts (optional) ===
+                res = results[root]
                 if charts:
-                    sampled_for_types.extend(sample_files_for_types(root, filetype_min_mb))
-                    self._progress_step(1)
-
-            # write report
-            report_path.write_text("\n".join(lines))
-
-            # charts
+                    per_root_pairs[root] = res["pairs"]
+                all_top_folders.extend(res["folders"])
+                all_top_files.extend(res["files"])
+                ext_counter.update(res["ext_totals"])
+                buf.write(res["report"])
+
+            # charts: build the jobs here, render them in a spawned process
+            jobs = []
             if charts:
                 desktop = HOME / "Desktop"
                 desktop.mkdir(exist_ok=True)
 
                 if all_top_folders:
-                    top_folders_sorted = sorted(all_top_folders, key=lambda x: x[0], reverse=True)[:30]
+                    top_folders_sorted = heapq.nlargest(30, all_top_folders, key=lambda x: x[0])
                     labels = [p for _, p in top_folders_sorted]
-                    values = [round(human_gb(s), 2) for s, _ in top_folders_sorted]
-                    save_bar_chart("Top Folders by Size (GB)", labels, values, desktop / "Storage_TopFolders.png")
+                    values = [round(s / GIB, 2) for s, _ in top_folders_sorted]
+                    jobs.append(("bar", "Top Folders by Size (GB)", labels, values, desktop / "Storage_TopFolders.png"))
 
                 if include_files and all_top_files:
-                    top_files_sorted = sorted(all_top_files, key=lambda x: x[0], reverse=True)[:30]
+                    top_files_sorted = heapq.nlargest(30, all_top_files, key=lambda x: x[0])
                     labels = [p for _, p in top_files_sorted]
-                    values = [round(human_gb(s), 2) for s, _ in top_files_sorted]
-                    save_bar_chart("Top Files by Size (GB)", labels, values, desktop / "Storage_TopFiles.png")
+                    values = [round(s / GIB, 2) for s, _ in top_files_sorted]
+                    jobs.append(("bar", "Top Files by Size (GB)", labels, values, desktop / "Storage_TopFiles.png"))
 
                 root_totals = accumulate_root_totals(per_root_pairs)
                 if root_totals:
                     labels = list(root_totals.keys())
-                    values = [human_gb(v) for v in root_totals.values()]
-                    save_pie_chart("Storage by Root Directory (Approx.)", labels, values, desktop / "Storage_ByRoot.png")
+                    values = [v / GIB for v in root_totals.values()]
+                    jobs.append(("pie", "Storage by Root Directory (Approx.)", labels, values, desktop / "Storage_ByRoot.png"))
 
-                if sampled_for_types:
-                    ext_tot = filetype_totals(sampled_for_types)
-                    labels = list(ext_tot.keys())
-                    values = [human_gb(v) for v in ext_tot.values()]
-                    save_pie_chart("Storage by File Type (extensions)", labels, values, desktop / "Storage_ByFileType.png")
+                if ext_counter:
+                    labels = list(ext_counter.keys())
+                    values = [v / GIB for v in ext_counter.values()]
+                    jobs.append(("pie", "Storage by File Type (extensions)", labels, values, desktop / "Storage_ByFileType.png"))
 
-            self.set_status_safe(f"Done. Report saved to: {REPORT_PATH}")
+            self._finish_in_background(report_path, buf.getvalue(), jobs)
             # finalize progress
             self._progress_step(0)  # refresh label one last time
         except Exception as e:
             self.set_status_safe(f"Error: {e}")
             messagebox.showerror("Error", str(e))
+        finally:
+            self.after(0, self._scan_done)
+
+    def _finish_in_background(self, report_path, report_text, jobs):
+        """
+        Write the report on a helper thread (and hand chart jobs to a spawned process)
+        so the scan completes right away; the helper posts the final status.
+        A new scan may start before the helper is done: writers take _report_lock and
+        never overwrite a newer scan's report, the file is replaced atomically, and a
+        superseded scan's statuses are dropped (see _set_scan_status).
+        """
+        gen = self._scan_gen  # stable: no new scan launches until _scan_done
+
+        def status(text):
+            self.after(0, self._set_scan_status, gen, text)
+
+        status("Writing report…" + (" • charts rendering…" if jobs else ""))
+        proc = render_charts_async(jobs) if jobs else None
+
+        def finish():
+            with self._report_lock:
+                if gen < self._report_gen:
+                    return  # a newer scan's report is already on disk
+                tmp = report_path.with_name(f"{report_path.name}.{gen}.tmp")
+                try:
+                    tmp.write_text(report_text, errors="surrogateescape")
+                    os.replace(tmp, report_path)
+                except OSError as e:
+                    status(f"Error writing report: {e}")
+                    return
+                self._report_gen = gen
+            if proc is None:
+                status(f"Done. Report saved to: {report_path}")
+                return
+            status(f"Report saved to: {report_path} — charts rendering…")
+            proc.join()
+            if proc.exitcode == 0:
+                status(f"Done. Report saved to: {report_path} • Charts saved to Desktop")
+            else:
+                status(f"Report saved to: {report_path} • Chart rendering failed (exit {proc.exitcode})")
+
+        threading.Thread(target=finish, daemon=True).start()
 
     # thread-safe UI updates
-    def tree_insert_safe(self, size_gb, path, kind):
-        self.after(0, lambda: self.tree.insert("", "end", values=(size_gb, path, kind)))
+    def tree_insert_safe(self, size_bytes, path, kind):
+        with self._pending_lock:
+            self._pending_rows.append((size_bytes, path, kind))
+
+    def tree_remove_safe(self, path, kind):
+        with self._pending_lock:
+            self._pending_removals.append((path, kind))
+
+    def _start_row_pump(self):
+        if self._flush_job is None:
+            self._flush_job = self.after(100, self._flush_rows)
+
+    def _stop_row_pump(self):
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        self._flush_rows(reschedule=False)  # drain whatever the workers queued last
+
+    def _flush_rows(self, reschedule=True):
+        """Apply every queued insert/removal in one Tk callback (instead of one after(0) per row)."""
+        with self._pending_lock:
+            rows, self._pending_rows = self._pending_rows, []
+            removals, self._pending_removals = self._pending_removals, []
+        # a row queued and taken back out within the same batch is never inserted
+        for path, kind in removals:
+            for idx, row in enumerate(rows):
+                if row[1] == path and row[2] == kind:
+                    del rows[idx]
+                    break
+            else:
+                for idx, row in enumerate(self._rows):
+                    if row[1] == path and row[2] == kind:
+                        self.tree.delete(row[3])
+                        del self._rows[idx]
+                        break
+        if rows:
+            # hide the columns while bulk-inserting so the tree lays out once, not per row
+            self.tree.configure(displaycolumns=())
+            insert = self.tree.insert
+            add_row = self._rows.append
+            for size_bytes, path, kind in rows:
+                iid = insert("", "end", values=(f"{size_bytes / GIB:6.2f}", path, kind))
+                add_row((size_bytes, path, kind, iid, path.lower()))
+            self.tree.configure(displaycolumns="#all")
+        if reschedule:
+            self._flush_job = self.after(100, self._flush_rows)
 
     def set_status_safe(self, text):
-        self.after(0, lambda: self.status.configure(text=text))
+        self.after(0, self._set_status, text)
+
+    # main-thread setter posted via after(0, method, arg) — no per-call closure
+    def _set_status(self, text):
+        self.status["text"] = text
+
+    def _set_scan_status(self, gen, text):
+        """Like _set_status, but dropped once a newer scan than 'gen' has been launched."""
+        if gen == self._scan_gen:
+            self.status["text"] = text
 
 
 if __name__ == "__main__":
@@ -4,36 +4,129 @@ mac_system_scanner.py — Deep macOS Storage Analyzer (CLI)
 Thin CLI that:
   • Parses args
   • Calls helpers in storage_utils.py
-  • Prints a Rich table + progress bar
-  • Writes a Desktop report
+  • Prints a Rich table + per-folder progress
+  • Writes a Desktop report (and optionally a JSON copy with --json)
   • (Optional) Saves charts via storage_utils if --charts is enabled
 """
 
 import argparse
+import heapq
+import json
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
 
 from rich.console import Console
-from rich.progress import track
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+try:
+    import orjson  # optional: faster --json output
+except ImportError:
+    orjson = None
+
 from storage_utils import (
-    du_list,
+    cached_du_list,
+    cached_scan_tree,
     leaf_only,
-    find_big_files,
+    cached_find_big_files,
     sample_files_for_types,
-    human_gb,
     accumulate_root_totals,
     filetype_totals,
     save_bar_chart,
     save_pie_chart,
+    is_solid_state,
+    extend_prune,
+    dedupe_roots,
+    cached_run,
+    SCAN_ENGINES,
+    SCAN_WORKERS,
+    GIB,
 )
 
 console = Console()
+err_console = Console(stderr=True)
 HOME = Path.home()
 DEFAULT_ROOTS = ["/Library", "/private", "/System", str(HOME), str(HOME / "Library")]
 REPORT_PATH = HOME / "Desktop/SystemDataReport_Deep.txt"
+MAX_ROOT_WORKERS = 6
+
+
+def write_json_report(path, payload):
+    """
+    Write payload as JSON (orjson when installed) to a temp file, then os.replace it into place.
+    orjson rejects the lone surrogates os.fsdecode uses for non-UTF-8 names; json escapes them.
+    """
+    data = None
+    if orjson:
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # surrogates in a path: fall back to json
+    if data is None:
+        data = (json.dumps(payload) + "\n").encode()
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def scan_root(root, args, on_dir=None, walk_workers=SCAN_WORKERS):
+    """
+    Scan one root (runs on a pool thread) and return its results for merging in root order.
+    on_dir(path) fires per folder the native walk visits (not for --engine du or cache hits);
+    walk_workers is the native walk's thread count within the root.
+    """
+    fused = (args.files or args.charts) and args.engine == "native"
+    if fused:
+        # one walk for folder sizes, big files and file-type totals
+        pairs, big_files, ext_totals = cached_scan_tree(
+            root, args.depth, int(args.min_file_gb * GIB) if args.files else None, args.top, None,
+            args.filetype_min_mb * 1024 * 1024 if args.charts else None, on_dir=on_dir, workers=walk_workers,
+            refresh=args.no_cache,
+        )
+    else:
+        # --no-cache still rewrites the cached entries, so the next cached run starts fresh
+        pairs = cached_du_list(root, args.depth, args.engine, refresh=args.no_cache,
+                               on_dir=on_dir, workers=walk_workers)
+        big_files = cached_find_big_files(root, args.min_file_gb, args.top, args.no_cache) if args.files else []
+        ext_totals = filetype_totals(sample_files_for_types(root, args.filetype_min_mb)) if args.charts else {}
+    raw_pairs = pairs if args.charts else None  # raw rows only feed the by-root pie
+
+    # filter + de-dup + limit
+    min_bytes = int(args.min_gb * GIB)  # sizes stay int bytes until formatting
+    kept = (p for p in pairs if p[0] >= min_bytes)  # lazy: nlargest filters and selects in one pass
+    if args.leaf_only:
+        kept = leaf_only(list(kept))  # needs every surviving path to spot parents
+    pairs = heapq.nlargest(args.top, kept, key=lambda x: x[0])
+    return {"pairs": raw_pairs, "folders": pairs, "files": big_files, "ext_totals": ext_totals}
+
+
+def scan_roots(args):
+    """Scan every root and return {root: scan_root(...) result}."""
+    # Scan roots concurrently (the walk is syscall-bound and releases the GIL);
+    # a spinning disk gets one root at a time, each walked by a single thread,
+    # so the head isn't thrashed.
+    ssd = all(is_solid_state(root) for root in args.roots)
+    workers = min(len(args.roots), MAX_ROOT_WORKERS) if ssd else 1
+    walk_workers = SCAN_WORKERS if ssd else 1
+    results = {}
+    columns = (SpinnerColumn(), TextColumn("[bold]{task.description}"), BarColumn(),
+               TextColumn("{task.completed} dirs"))
+    with Progress(*columns, console=err_console, transient=True) as progress:
+        task = progress.add_task("🔍 Scanning directories...", total=None)
+
+        def on_dir(path):
+            # called from walker threads; Progress.update takes its own lock
+            progress.update(task, advance=1, description=f"🔍 Scanning {path}")
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(scan_root, root, args, on_dir, walk_workers): root for root in args.roots}
+            for fut in as_completed(futures):
+                results[futures[fut]] = fut.result()
+                progress.update(task, description=f"🔍 Finished {futures[fut]} ({len(results)}/{len(futures)} roots)")
+    return results
 
 
 def main():
@@ -42,13 +135,28 @@ def main():
     ap.add_argument("--depth", type=int, default=3, help="Folder depth for 'du' (default 3).")
     ap.add_argument("--top", type=int, default=30, help="Top N results per root (default 30).")
     ap.add_argument("--min-gb", type=float, default=0.5, help="Min folder size (GB) to include.")
+    ap.add_argument("--engine", choices=SCAN_ENGINES, default="native",
+                    help="Folder sizing: in-process walk (native) or the 'du' binary (du).")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="Ignore cached results and rescan every root (the caches are rewritten).")
+    ap.add_argument("--cache-ttl", type=float, default=3600, metavar="SECONDS",
+                    help="Reuse a whole previous run with the same options this recent (default 3600; 0 disables "
+                         "this, but per-root caches still apply — use --no-cache to rescan everything).")
+    ap.add_argument("--prune", nargs="*", default=[], metavar="DIR",
+                    help="Extra folders to skip entirely (added to the built-in system prune list).")
     ap.add_argument("--leaf-only", action="store_true", help="Show only leaf-level folders.")
     ap.add_argument("--files", action="store_true", help="Also show largest individual files.")
     ap.add_argument("--min-file-gb", type=float, default=1.0, help="Min file size (GB) for 'Top files'.")
     ap.add_argument("--charts", action="store_true", help="Generate PNG charts on Desktop.")
     ap.add_argument("--filetype-min-mb", type=int, default=50, help="Only count files >= this MB for file-type chart.")
     ap.add_argument("--report", default=str(REPORT_PATH), help="Report save path.")
+    ap.add_argument("--json", action="store_true", help="Also write the results as JSON next to the report (.json).")
     args = ap.parse_args()
+    if args.prune:
+        extend_prune(args.prune)
+    args.roots, dropped = dedupe_roots(args.roots)
+    if dropped:
+        err_console.print(f"[yellow]Skipping roots already covered by another root: {', '.join(dropped)}[/yellow]")
 
     ts = datetime.now().strftime("%Y-%m-%d %H:%M")
     report_path = Path(args.report)
@@ -61,68 +169,90 @@ def main():
     if args.files:
         table.add_column("Type", justify="left")
 
-    lines = [
-        f"=== macOS Deep Storage Report — {ts} ===",
-        f"Roots: {', '.join(args.roots)}",
-        f"Depth: {args.depth} | Leaf-only: {args.leaf_only} | MinGB: {args.min_gb} | Top: {args.top}",
-    ]
-    if args.files:
-        lines.append(f"Files: enabled | MinFileGB: {args.min_file_gb}")
-    if args.charts:
-        lines.append(f"Charts: enabled | FileTypeMinMB: {args.filetype_min_mb}")
-    lines.append("")
-
     # Holders for charts
-    per_root_pairs = defaultdict(list)   # root -> [(bytes, path)]
+    per_root_pairs = {}                 # root -> [(bytes, path)], only kept with --charts
     all_top_folders = []                # [(bytes, path)]
     all_top_files = []                  # [(bytes, path)]
-    sampled_for_types = []              # [(bytes, path)] across roots
-
-    # Scan
-    for root in track(args.roots, description="🔍 Scanning directories..."):
-        lines.append(f"\n### Root: {root}")
-        pairs = du_list(root, args.depth)
-        per_root_pairs[root].extend(pairs)  # keep raw for root totals
-
-        # filter + de-dup + limit
-        pairs = [p for p in pairs if human_gb(p[0]) >= args.min_gb]
-        if args.leaf_only:
-            pairs = leaf_only(pairs)
-        pairs = sorted(pairs, key=lambda x: x[0], reverse=True)[:args.top]
-
-        if not pairs:
-            lines.append("  (no folders above threshold)")
-        else:
-            lines.append("  Top folders:")
-            for size_bytes, path in pairs:
-                gb = human_gb(size_bytes)
-                all_top_folders.append((size_bytes, path))
-                color = "red" if gb > 10 else "yellow"
-                if args.files:
-                    table.add_row(f"[{color}]{gb:6.2f}[/{color}]", path, "folder")
-                else:
-                    table.add_row(f"[{color}]{gb:6.2f}[/{color}]", path)
-                lines.append(f"{gb:6.2f}G\t{path}")
+    ext_totals = Counter()              # extension -> bytes across roots
+
+    # A recent run with the same roots and options (and unchanged root manifests) is
+    # reused whole; the table and report below are rebuilt from its results.
+    # --no-cache rescans and rewrites the saved run.
+    scanned = []
+
+    def compute():
+        scanned.append(True)
+        return scan_roots(args)
 
+    run_key = repr((args.depth, args.min_gb, args.top, args.leaf_only, args.engine, args.files,
+                    args.min_file_gb, args.charts, args.filetype_min_mb))
+    results = cached_run(args.roots, run_key, compute, args.cache_ttl, refresh=args.no_cache)
+    if not scanned:
+        err_console.print("[dim]Reusing results from a recent run with the same options "
+                          "(--no-cache to rescan).[/dim]")
+
+    # Merge in the order the roots were given, writing the report as we go (buffered)
+    # surrogateescape writes non-UTF-8 names (os.fsdecode'd) back as their original bytes
+    with open(report_path, "w", buffering=1 << 20, errors="surrogateescape") as rpt:
+        w = rpt.write
+        w(f"=== macOS Deep Storage Report — {ts} ===\n")
+        w(f"Roots: {', '.join(args.roots)}\n")
+        w(f"Depth: {args.depth} | Leaf-only: {args.leaf_only} | MinGB: {args.min_gb} | Top: {args.top}\n")
         if args.files:
-            big_files = find_big_files(root, args.min_file_gb, args.top)
-            if big_files:
-                lines.append("  Top files:")
-                for size_bytes, path in big_files:
-                    gb = human_gb(size_bytes)
-                    all_top_files.append((size_bytes, path))
-                    table.add_row(f"[cyan]{gb:6.2f}[/cyan]", path, "file")
-                    lines.append(f"{gb:6.2f}G\t{path}")
+            w(f"Files: enabled | MinFileGB: {args.min_file_gb}\n")
+        if args.charts:
+            w(f"Charts: enabled | FileTypeMinMB: {args.filetype_min_mb}\n")
+        w("\n")
+        for root in args.roots:
+            res = results[root]
+            w(f"\n### Root: {root}\n")
+            if args.charts:
+                per_root_pairs[root] = res["pairs"]
+                ext_totals.update(res["ext_totals"])
+
+            pairs = res["folders"]
+            big_files = res["files"]
+            if not pairs:
+                w("  (no folders above threshold)\n")
             else:
-                lines.append("  (no files above threshold)")
+                w("  Top folders:\n")
+                for size_bytes, path in pairs:
+                    gb = size_bytes / GIB
+                    all_top_folders.append((size_bytes, path))
+                    color = "red" if size_bytes > 10 * GIB else "yellow"
+                    if args.files:
+                        table.add_row(f"[{color}]{gb:6.2f}[/{color}]", path, "folder")
+                    else:
+                        table.add_row(f"[{color}]{gb:6.2f}[/{color}]", path)
+                    w(f"{gb:6.2f}G\t{path}\n")
 
-        if args.charts:
-            sampled_for_types.extend(sample_files_for_types(root, args.filetype_min_mb))
+            if args.files:
+                if big_files:
+                    w("  Top files:\n")
+                    for size_bytes, path in big_files:
+                        gb = size_bytes / GIB
+                        all_top_files.append((size_bytes, path))
+                        table.add_row(f"[cyan]{gb:6.2f}[/cyan]", path, "file")
+                        w(f"{gb:6.2f}G\t{path}\n")
+                else:
+                    w("  (no files above threshold)\n")
 
-    # Write report + print table
-    report_path.write_text("\n".join(lines))
+    # Print table (+ machine-readable copy)
     console.print(table)
     console.print(f"\n✅ Deep report saved to: [green]{report_path}[/green]")
+    if args.json:
+        json_path = report_path.with_suffix(".json")
+        if json_path == report_path:  # --report already ends in .json
+            json_path = report_path.with_name(report_path.name + ".json")
+        write_json_report(json_path, {
+            "generated": ts,
+            "roots": args.roots,
+            "folders": [{"root": root, "size_bytes": s, "path": p}
+                        for root in args.roots for s, p in results[root]["folders"]],
+            "files": [{"root": root, "size_bytes": s, "path": p}
+                      for root in args.roots for s, p in results[root]["files"]],
+        })
+        console.print(f"🧾 JSON saved to: [green]{json_path}[/green]")
 
     # Charts (optional)
     if args.charts:
@@ -131,30 +261,29 @@ def main():
 
         # 1) Top folders bar
         if all_top_folders:
-            top_folders_sorted = sorted(all_top_folders, key=lambda x: x[0], reverse=True)[:30]
+            top_folders_sorted = heapq.nlargest(30, all_top_folders, key=lambda x: x[0])
             labels = [p for _, p in top_folders_sorted]
-            values = [round(human_gb(s), 2) for s, _ in top_folders_sorted]
+            values = [round(s / GIB, 2) for s, _ in top_folders_sorted]
             save_bar_chart("Top Folders by Size (GB)", labels, values, desktop / "Storage_TopFolders.png", xlabel="GB")
 
         # 2) Top files bar
         if args.files and all_top_files:
-            top_files_sorted = sorted(all_top_files, key=lambda x: x[0], reverse=True)[:30]
+            top_files_sorted = heapq.nlargest(30, all_top_files, key=lambda x: x[0])
             labels = [p for _, p in top_files_sorted]
-            values = [round(human_gb(s), 2) for s, _ in top_files_sorted]
+            values = [round(s / GIB, 2) for s, _ in top_files_sorted]
             save_bar_chart("Top Files by Size (GB)", labels, values, desktop / "Storage_TopFiles.png", xlabel="GB")
 
         # 3) Directory share by root (pie)
         root_totals = accumulate_root_totals(per_root_pairs)
         if root_totals:
             labels = list(root_totals.keys())
-            values = [human_gb(v) for v in root_totals.values()]
+            values = [v / GIB for v in root_totals.values()]
             save_pie_chart("Storage by Root Directory (Approx.)", labels, values, desktop / "Storage_ByRoot.png")
 
         # 4) File-type distribution (pie)
-        if sampled_for_types:
-            ext_totals = filetype_totals(sampled_for_types)
+        if ext_totals:
             labels = list(ext_totals.keys())
-            values = [human_gb(v) for v in ext_totals.values()]
+            values = [v / GIB for v in ext_totals.values()]
             save_pie_chart("Storage by File Type (extensions)", labels, values, desktop / "Storage_ByFileType.png")
 
         console.print("🖼  Charts saved to Desktop:")
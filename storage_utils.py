@@ -2,173 +2,1005 @@
 storage_utils.py — helpers for macOS storage scanning & charts
 
 Responsibilities:
-  • Shell wrappers: du/find/stat
-  • Directory size collection (depth-limited), leaf-only filtering
-  • Largest-file discovery
+  • Shell wrappers: find/stat
+  • Directory size collection (in-process os.scandir walk, depth-limited), leaf-only filtering
+  • On-disk caches: per-folder sizes (SQLite) and per-root results (pickle)
+  • Largest-file discovery and file-type totals (fused into the folder walk, or on their own)
   • Simple unit conversion
-  • Optional matplotlib charts (kept generic and single-plot per chart)
+  • Optional matplotlib charts (kept generic and single-plot per chart; imported on first use)
 
 Notes:
-  - Uses BSD/macOS flags (e.g., stat -f "%z %N", find -size +1G).
+  - Uses BSD/macOS flags (e.g., stat -f "%b %N", find -xdev).
+  - Sizes are on-disk usage (allocated blocks, like du), not logical st_size: APFS
+    clones, compression and sparse files would otherwise be overcounted.
+  - du_list walks in-process instead of forking 'du' per root; on macOS each folder is
+    listed with one getattrlistbulk(2) call (name+type+size per entry), else os.scandir.
+  - Files with several hard links are counted once per (st_dev, st_ino), as du does.
   - We intentionally do NOT set explicit matplotlib colors and we plot one chart per figure.
 """
 
 from __future__ import annotations
+import ctypes
+import errno
+import hashlib
+import heapq
+import os
+import pickle
+import plistlib
+import queue
+import sqlite3
+import struct
 import subprocess
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
 from pathlib import Path
-from collections import Counter, defaultdict
-from typing import List, Tuple, Dict
-import matplotlib as plt
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-# Matplotlib is optional; utils guard their usage.
+# blake3 is optional (faster cache-key hashing); hashlib.blake2b otherwise.
 try:
-    import matplotlib.pyplot as plt  # noqa: F401
-except Exception:
-    plt = None  # type: ignore
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
 
 
 # ---------- Shell helpers ----------
 
-def run(cmd: list[str]) -> str:
-    """Run a shell command and return stdout; silence stderr to skip SIP noise."""
+def run(cmd: list[str]) -> bytes:
+    """
+    Run a shell command and return its raw stdout; silence stderr to skip SIP noise.
+    Output stays bytes: no decoder pass over it, and callers split on ASCII
+    separators, decoding only the fields they keep (os.fsdecode for paths).
+    """
     return subprocess.run(
-        cmd, text=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False
     ).stdout
 
 
+_solid_state_by_mount: Dict[str, bool] = {}
+_solid_state_lock = threading.Lock()
+
+
+def is_solid_state(path: str) -> bool:
+    """
+    False only if diskutil reports the volume holding 'path' as rotational
+    (SolidState = false); unknown (not macOS, diskutil failed) counts as SSD.
+    Callers use it to avoid concurrent walks thrashing a spinning disk's head.
+    diskutil is asked once per mount point per process.
+    """
+    mount = os.path.realpath(path)
+    while not os.path.ismount(mount):
+        mount = os.path.dirname(mount)
+    with _solid_state_lock:
+        if mount not in _solid_state_by_mount:
+            try:
+                ssd = bool(plistlib.loads(run(["diskutil", "info", "-plist", mount])).get("SolidState", True))
+            except Exception:
+                ssd = True  # no diskutil / no plist output
+            _solid_state_by_mount[mount] = ssd
+        return _solid_state_by_mount[mount]
+
+
+# ---------- Directory listing (getattrlistbulk / scandir) ----------
+
+# <sys/attr.h>
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_DEVID = 0x00000002
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_FILEID = 0x02000000
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_DIR_ALLOCSIZE = 0x00000008
+ATTR_FILE_LINKCOUNT = 0x00000001
+ATTR_FILE_ALLOCSIZE = 0x00000004
+VDIR = 2  # fsobj_type_t for directories
+
+# list_dir row: (child_path, is_dir, disk_bytes, st_dev, link_ino)
+DirRow = Tuple[str, bool, int, int, int]
+
+_BULK_BUFSIZE = 64 * 1024
+_bulk_local = threading.local()  # one reusable attr buffer per scanning thread
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+_BULK_ATTRS = _AttrList(
+    bitmapcount=ATTR_BIT_MAP_COUNT,
+    commonattr=(ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_ERROR | ATTR_CMN_NAME | ATTR_CMN_DEVID
+                | ATTR_CMN_OBJTYPE | ATTR_CMN_FILEID),
+    dirattr=ATTR_DIR_ALLOCSIZE,
+    fileattr=ATTR_FILE_LINKCOUNT | ATTR_FILE_ALLOCSIZE,
+)
+
+# getattrlistbulk is macOS-only (10.10+); everything else falls back to os.scandir.
+_getattrlistbulk = None
+if sys.platform == "darwin":
+    try:
+        _getattrlistbulk = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True).getattrlistbulk
+        _getattrlistbulk.argtypes = [ctypes.c_int, ctypes.POINTER(_AttrList), ctypes.c_void_p,
+                                     ctypes.c_size_t, ctypes.c_uint64]
+        _getattrlistbulk.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _getattrlistbulk = None
+
+
+# Folders are opened as directories only, close-on-exec, and — except for a scan's root,
+# which may legitimately be a symlink like /tmp — without following a symlink that
+# replaced the folder after its parent was listed.
+_DIR_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+
+def _open_dir(path: str, follow_symlinks: bool) -> int:
+    return os.open(path, _DIR_FLAGS if follow_symlinks else _DIR_FLAGS | _NOFOLLOW)
+
+
+def _bulk_scandir(path: str, follow_symlinks: bool = False) -> List[DirRow]:
+    """
+    List 'path' with getattrlistbulk(2): [(child_path, is_dir, alloc_bytes, st_dev, link_ino)].
+    One syscall returns a whole buffer of packed, variable-length records:
+      u_int32 length | attribute_set_t returned | [u_int32 error] | [attrreference_t name]
+      | [dev_t devid] | [fsobj_type_t objtype] | [u_int64 fileid]
+      | folders: [off_t dir allocsize] | files: [u_int32 linkcount] [off_t allocsize]
+    (attributes appear only when their bit is set in 'returned'; volumes that don't
+    report a folder's allocation size leave it at 0).
+    Raises OSError (e.g. ENOTSUP on some network volumes) like os.scandir would.
+    """
+    buf = getattr(_bulk_local, "buf", None)
+    if buf is None:
+        buf = _bulk_local.buf = ctypes.create_string_buffer(_BULK_BUFSIZE)
+    raw = memoryview(buf).cast("B")  # parse in place: no 64 KiB bytes copy per call
+
+    fd = _open_dir(path, follow_symlinks)
+    try:
+        rows: List[DirRow] = []
+        while True:
+            count = _getattrlistbulk(fd, ctypes.byref(_BULK_ATTRS), buf, _BULK_BUFSIZE, 0)
+            if count < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), path)
+            if count == 0:
+                return rows
+            off = 0
+            for _ in range(count):
+                (length, common, _vol, dirattr, fileattr, _fork) = struct.unpack_from("=6I", raw, off)
+                pos = off + 24
+                off += length
+                if common & ATTR_CMN_ERROR:
+                    (entry_err,) = struct.unpack_from("=I", raw, pos)
+                    pos += 4
+                    if entry_err:
+                        continue
+                name = ""
+                if common & ATTR_CMN_NAME:
+                    (name_off, name_len) = struct.unpack_from("=iI", raw, pos)
+                    start = pos + name_off
+                    name = os.fsdecode(raw[start:start + name_len].tobytes().split(b"\0", 1)[0])
+                    pos += 8
+                dev = 0
+                if common & ATTR_CMN_DEVID:
+                    (dev,) = struct.unpack_from("=i", raw, pos)
+                    pos += 4
+                objtype = 0
+                if common & ATTR_CMN_OBJTYPE:
+                    (objtype,) = struct.unpack_from("=I", raw, pos)
+                    pos += 4
+                ino = 0
+                if common & ATTR_CMN_FILEID:
+                    (ino,) = struct.unpack_from("=Q", raw, pos)
+                    pos += 8
+                size = 0
+                nlink = 1
+                if dirattr & ATTR_DIR_ALLOCSIZE:
+                    (size,) = struct.unpack_from("=q", raw, pos)
+                if fileattr & ATTR_FILE_LINKCOUNT:
+                    (nlink,) = struct.unpack_from("=I", raw, pos)
+                    pos += 4
+                if fileattr & ATTR_FILE_ALLOCSIZE:
+                    (size,) = struct.unpack_from("=q", raw, pos)
+                is_dir = objtype == VDIR
+                if name and (is_dir or size):  # files with no allocated blocks add nothing
+                    rows.append((os.path.join(path, name), is_dir, size, dev,
+                                 ino if nlink > 1 and not is_dir else 0))
+    finally:
+        os.close(fd)
+
+
+def _scandir_list(path: str, follow_symlinks: bool = False) -> List[DirRow]:
+    """
+    Portable fallback: same rows as _bulk_scandir, via os.scandir + DirEntry.stat() (st_blocks * 512).
+    Entry type comes from readdir's d_type (is_dir/is_file cost no syscall), so only
+    folders and regular files are stat'ed; symlinks, sockets etc. are skipped unstat'ed.
+    The folder is scanned through an fd, so each stat is an fstatat(fd, name,
+    AT_SYMLINK_NOFOLLOW) instead of a lookup of the full path.
+    """
+    rows: List[DirRow] = []
+    prefix = path if path.endswith("/") else path + "/"
+    fd = _open_dir(path, follow_symlinks)
+    try:
+        with os.scandir(fd) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if not is_dir and not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir or st.st_blocks:
+                    rows.append((prefix + entry.name, is_dir, st.st_blocks * 512, st.st_dev,
+                                 st.st_ino if st.st_nlink > 1 and not is_dir else 0))
+    finally:
+        os.close(fd)
+    return rows
+
+
+def list_dir(path: str, follow_symlinks: bool = False) -> List[DirRow]:
+    """
+    Return [(child_path, is_dir, disk_bytes, st_dev, link_ino)] for one folder, never
+    following symlinks among its entries. link_ino is the file's inode number when it
+    has other hard links (so callers can count it once, like du), else 0.
+    The folder itself is opened with O_NOFOLLOW unless follow_symlinks (pass it for
+    a scan root given through a symlink).
+    Files with zero allocated blocks (dataless/cloud placeholders) are left out.
+    Uses getattrlistbulk on macOS and falls back to os.scandir when it is unavailable
+    or the volume does not support it (ENOTSUP/EINVAL).
+    """
+    if _getattrlistbulk is not None:
+        try:
+            return _bulk_scandir(path, follow_symlinks)
+        except OSError as e:
+            if e.errno not in (errno.ENOTSUP, errno.EINVAL):
+                raise
+    return _scandir_list(path, follow_symlinks)
+
+
 # ---------- Core scan helpers ----------
 
-def du_list(dir_path: str, depth: int) -> List[Tuple[int, str]]:
+SCAN_ENGINES = ("native", "du")  # in-process walk, or the C 'du' binary
+SCAN_WORKERS = 8  # threads listing folders concurrently within one root (native engine)
+
+# Subtrees du_list never descends into: the volumes mounted under /System/Volumes
+# (Data is the live volume again and double counts everything), swap/sleepimage,
+# system-managed indexes/journals, document versions and per-volume trash, and
+# OS-owned content that can't be freed from here (templates, Apple's /Library
+# payloads, the iCloud Drive daemon's cache).
+PRUNE = frozenset({
+    "/System/Volumes",
+    "/System/Library/Templates",
+    "/Library/Apple",
+    "/private/var/vm",
+    "/private/var/db/ConfigurationProfiles/Store",
+    "/.Spotlight-V100",
+    "/.fseventsd",
+    "/.DocumentRevisions-V100",
+    "/.Trashes",
+    str(Path.home() / "Library/Caches/com.apple.bird"),
+})
+
+
+def extend_prune(paths: Iterable[str]) -> None:
     """
-    Return [(size_bytes, path)] up to 'depth' using 'du -kxdN'.
-    -k  : sizes in KiB (easy to convert to bytes)
-    -x  : stay on the same filesystem
-    -dN : recurse N levels deep
+    Add user-given folders to PRUNE for this process. Each is ~-expanded and made
+    absolute against the current directory (so "node_modules" or "./build" work), and
+    its realpath is added too, as dedupe_roots and _prune_for compare resolved paths.
     """
-    out = run(["du", "-kxd" + str(depth), dir_path])
-    rows: List[Tuple[int, str]] = []
-    for line in out.splitlines():
-        parts = line.split("\t", 1)
-        if len(parts) != 2:
-            continue
+    global PRUNE
+    added = set()
+    for p in paths:
+        path = os.path.abspath(os.path.expanduser(p))
+        added.add(path)
+        added.add(os.path.realpath(path))
+    PRUNE = PRUNE | added
+
+
+def _prune_for(root: str) -> frozenset:
+    """
+    PRUNE spelled the way paths under 'root' will be: a root given through a symlink
+    (/var, /tmp, /etc → /private/...) is resolved once here, not per folder.
+    """
+    real = os.path.realpath(root)
+    if real == root:
+        return PRUNE
+    prefix = real.rstrip("/") + "/"
+    return PRUNE | {root.rstrip("/") + p[len(prefix) - 1:] for p in PRUNE if p.startswith(prefix)}
+
+
+def dedupe_roots(roots: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """
+    Split roots into (kept, dropped), dropping any root another root's scan already
+    covers: a repeat, or a folder nested under a kept root on the same volume and
+    outside PRUNE (e.g. ~/Library under ~). Paths are compared after realpath;
+    kept roots stay in the given order.
+    """
+    roots = list(roots)
+    real = [os.path.realpath(r) for r in roots]
+    kept_real: List[Tuple[str, Optional[int]]] = []  # (realpath, st_dev) of kept roots
+    keep = set()
+    for i in sorted(range(len(roots)), key=lambda i: (len(real[i]), i)):
+        path = real[i]
         try:
-            kib = int(parts[0])
-        except ValueError:
-            continue
-        rows.append((kib * 1024, parts[1]))  # bytes
+            dev: Optional[int] = os.stat(path).st_dev
+        except OSError:
+            dev = None
+        covered = any(
+            os.path.commonpath([k, path]) == k and k_dev == dev
+            and not any(path == p or path.startswith(p.rstrip("/") + "/") for p in PRUNE)
+            for k, k_dev in kept_real
+        )
+        if not covered:
+            kept_real.append((path, dev))
+            keep.add(i)
+    return ([r for i, r in enumerate(roots) if i in keep],
+            [r for i, r in enumerate(roots) if i not in keep])
+
+
+FileCallback = Callable[[int, str, Optional[Tuple[int, str]]], None]
+DirCallback = Callable[[str], None]
+
+
+def du_list(dir_path: str, depth: int, engine: str = "native",
+            on_dir: Optional[DirCallback] = None, workers: int = SCAN_WORKERS) -> List[Tuple[int, str]]:
+    """
+    Return [(size_bytes, path)] for dir_path and every folder up to 'depth' levels
+    below it, each size covering the whole subtree (same rows as 'du -xdN').
+    engine="native" walks in-process (scan_tree); engine="du" hands the walk to the
+    'du' binary instead (see _du_via_subprocess), and on_dir/workers don't apply.
+    """
+    if engine == "du":
+        return _du_via_subprocess(dir_path, depth)
+    return scan_tree(dir_path, depth, workers=workers, on_dir=on_dir)[0]
+
+
+ScanResult = Tuple[List[Tuple[int, str]], List[Tuple[int, str]], Dict[str, int]]
+
+
+def scan_tree(dir_path: str, depth: int, min_file_bytes: Optional[int] = None, top: int = 0,
+              on_file: Optional[FileCallback] = None, type_min_bytes: Optional[int] = None,
+              workers: int = SCAN_WORKERS, du_cache: Optional["DuCache"] = None,
+              on_dir: Optional[DirCallback] = None) -> ScanResult:
+    """
+    One walk that produces du_list's folder rows, the 'top' largest files using
+    >= min_file_bytes and, with type_min_bytes, filetype_totals over files using
+    >= type_min_bytes — the tree is listed once instead of once per pass.
+    Each folder is listed with list_dir() (getattrlistbulk/os.scandir); no fork/exec and
+    no separate stat per entry:
+      - symlinks are never followed
+      - folders on another device are skipped (like du -x), as are PRUNE subtrees
+      - a file with several hard links is counted once, under its smallest path (like du)
+      - unreadable folders are skipped silently (SIP noise)
+    With workers > 1, folders are listed concurrently: a queue.Queue of folders feeds
+    'workers' threads, each lists one folder and enqueues its subfolders, so kernel
+    directory reads overlap. workers=1 walks depth-first with an explicit stack.
+    Folders deeper than 'depth' are still walked, but their sizes are charged
+    to their nearest reported ancestor instead of being tracked individually.
+    on_file(size_bytes, path, evicted) fires whenever a file enters the running
+    top-N, like find_big_files_iter (from worker threads when workers > 1).
+    on_dir(path) fires once per folder visited, before it is listed (same threads).
+    With du_cache (folder sizes only, no files wanted), a folder whose mtime/inode
+    match its cached row is not listed again; see DuCache.
+    Returns (folder_pairs, big_files desc, {ext: bytes}).
+    """
+    try:
+        root_st = os.stat(dir_path)
+    except OSError:
+        return [], [], {}
+    root_dev = root_st.st_dev
+    prune = _prune_for(dir_path)
+    want_files = min_file_bytes is not None and top > 0
+    want_types = type_min_bytes is not None
+    heap: List[Tuple[int, str]] = []
+    ext_totals: Dict[str, int] = {}
+
+    totals: Dict[str, int] = defaultdict(int)
+    totals[dir_path] = root_st.st_blocks * 512
+    reported: List[Tuple[str, str]] = []   # (path, parent path), parents always before children
+    # (st_dev, st_ino) -> (path, size, owner) of a hard-linked file's smallest path so far;
+    # charged once after the walk, so the folder that gets it doesn't depend on thread timing
+    links: Dict[Tuple[int, int], Tuple[str, int, str]] = {}
+    lock = threading.Lock()  # guards totals/reported/heap/ext_totals/links; taken once per folder
+    if want_files or want_types:
+        du_cache = None  # cached rows keep no per-file sizes
+
+    def add_big(entry: Tuple[int, str]) -> None:
+        """Offer a file to the running top-N (lock held, or walk finished)."""
+        if len(heap) < top:
+            heapq.heappush(heap, entry)
+            evicted = None
+        elif entry > heap[0]:
+            evicted = heapq.heappushpop(heap, entry)
+        else:
+            return
+        if on_file:
+            on_file(entry[0], entry[1], evicted)
+
+    def add_typed(size: int, child: str) -> None:
+        ext = _file_ext(child)
+        ext_totals[ext] = ext_totals.get(ext, 0) + size
+
+    def visit(path: str, level: int, owner: str) -> List[Tuple[str, int, str]]:
+        """List one folder, fold it into the shared totals, return its subfolders to walk."""
+        if on_dir:
+            on_dir(path)
+        big: List[Tuple[int, str]] = []
+        typed: List[Tuple[int, str]] = []
+        cached = None
+        if du_cache:
+            try:
+                dir_st = os.stat(path)  # before listing; see DuCache.store
+            except OSError:
+                return []
+            cached = du_cache.lookup(path, dir_st)
+        if cached is not None:
+            own, listed, linked = cached
+        else:
+            try:
+                entries = list_dir(path, path == dir_path)  # only the root may be a symlink
+            except OSError:
+                return []
+            own = 0
+            listed: List[Tuple[str, int, int]] = []
+            linked: List[Tuple[int, int, int, str]] = []  # (dev, ino, size, path), charged after the walk
+            for child, is_dir, size, dev, link_ino in entries:
+                if link_ino:
+                    linked.append((dev, link_ino, size, child))
+                elif not is_dir:
+                    own += size
+                    if want_files and size >= min_file_bytes:
+                        big.append((size, child))
+                    if want_types and size >= type_min_bytes:
+                        typed.append((size, child))
+                else:
+                    listed.append((child, size, dev))
+            if du_cache:
+                du_cache.store(path, dir_st, own, listed, linked)
+        subdirs = [(child, size) for child, size, dev in listed if dev == root_dev and child not in prune]
+
+        tasks: List[Tuple[str, int, str]] = []
+        with lock:
+            for dev, ino, size, child in linked:
+                best = links.get((dev, ino))
+                if best is None or child < best[0]:
+                    links[(dev, ino)] = (child, size, owner)
+            for entry in big:
+                add_big(entry)
+            for size, child in typed:
+                add_typed(size, child)
+            for child, size in subdirs:
+                if level < depth:
+                    reported.append((child, owner))
+                    totals[child] += size
+                    tasks.append((child, level + 1, child))
+                else:
+                    own += size
+                    tasks.append((child, level + 1, owner))
+            totals[owner] += own
+        return tasks
+
+    if workers <= 1:
+        stack = [(dir_path, 0, dir_path)]  # (path, level, reported owner)
+        while stack:
+            stack.extend(visit(*stack.pop()))
+    else:
+        q: "queue.Queue[Optional[Tuple[str, int, str]]]" = queue.Queue()
+
+        def worker() -> None:
+            while True:
+                task = q.get()
+                try:
+                    if task is None:
+                        return
+                    for sub in visit(*task):
+                        q.put(sub)  # enqueued before task_done, so q.join() can't finish early
+                finally:
+                    q.task_done()
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+        for t in threads:
+            t.start()
+        q.put((dir_path, 0, dir_path))
+        q.join()
+        for _ in threads:
+            q.put(None)
+        for t in threads:
+            t.join()
+
+    # each hard-linked file counts once, under its smallest path (like du, one link per inode)
+    for child, size, owner in links.values():
+        totals[owner] += size
+        if want_files and size >= min_file_bytes:
+            add_big((size, child))
+        if want_types and size >= type_min_bytes:
+            add_typed(size, child)
+
+    # bubble reported sizes up to their parents, deepest first (children before parents, like du)
+    rows: List[Tuple[int, str]] = []
+    for path, parent in reversed(reported):
+        totals[parent] += totals[path]
+        rows.append((totals[path], path))
+    rows.append((totals[dir_path], dir_path))
+    return rows, sorted(heap, reverse=True), ext_totals
+
+
+def _du_via_subprocess(root: str, depth: int) -> List[Tuple[int, str]]:
+    """
+    du_list rows from 'du -x -d N -k <root>' — C fts traversal, no per-entry Python work.
+    du's stdout is read line by line as it is produced (bytes, no decoder), so rows are
+    parsed while du is still walking and its output is never held whole; paths go
+    through os.fsdecode so non-UTF-8 names survive. du's -I only matches entry names,
+    so only PRUNE's dot-named system folders (.Spotlight-V100, .Trashes, ...) are
+    skipped on this path; -x already keeps du off the /System/Volumes mounts.
+    """
+    rows: List[Tuple[int, str]] = []
+    ignore: list[str] = []
+    for name in sorted({os.path.basename(p) for p in PRUNE}):
+        if name.startswith("."):
+            ignore += ["-I", name]
+    proc = subprocess.Popen(["du", "-x", *ignore, "-d", str(depth), "-k", root],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1 << 20)
+    try:
+        for line in proc.stdout:
+            kib, tab, path = line.rstrip(b"\n").partition(b"\t")
+            if tab and kib.isdigit():
+                rows.append((int(kib) * 1024, os.fsdecode(path)))
+    finally:
+        proc.stdout.close()
+        proc.wait()
     return rows
 
 
+CACHE_DIR = Path.home() / "Library/Caches/mac_system_scanner"
+CACHE_TTL = 24 * 3600      # seconds a per-root result may be served
+CACHE_MAX_ENTRIES = 2000   # oldest .pkl files are evicted beyond this
+
+
+def _digest(data: bytes) -> str:
+    """Hex digest for cache keys/manifests: blake3 if installed, else hashlib.blake2b."""
+    if blake3 is not None:
+        return blake3(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _root_manifest(dir_path: str, st: os.stat_result) -> str:
+    """
+    Digest of the root's own (mtime_ns, size) plus the mtime_ns of each entry directly
+    under it: catches changes one level below the root, which the root's mtime misses.
+    """
+    parts = [f"{st.st_mtime_ns}:{st.st_size}"]
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    parts.append(f"{entry.name}:{entry.stat(follow_symlinks=False).st_mtime_ns}")
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    parts.sort()
+    return _digest("\0".join(parts).encode("utf-8", "surrogateescape"))
+
+
+def _evict_old_cache_files() -> None:
+    """Keep at most CACHE_MAX_ENTRIES result files, dropping the least recently written."""
+    try:
+        files = [(e.stat().st_mtime, e.path) for e in os.scandir(CACHE_DIR) if e.name.endswith(".pkl")]
+    except OSError:
+        return
+    if len(files) <= CACHE_MAX_ENTRIES:
+        return
+    files.sort()
+    for _, path in files[:len(files) - CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _memo_file(key_text: str, manifest: str, compute: Callable[[], Any], ttl: float,
+               refresh: bool = False) -> Any:
+    """
+    Return compute() memoized on disk as CACHE_DIR/<digest(key_text)>.pkl, reused
+    while the stored manifest matches and the file is younger than ttl seconds.
+    refresh=True always computes and rewrites the entry.
+    Files are written to a temp name and os.replace'd in, so a concurrent reader
+    never sees a partial pickle. Cache read/write failures fall back to compute().
+    """
+    key_text += "|prune=" + "\0".join(sorted(PRUNE))  # --prune changes the result
+    cache_file = CACHE_DIR / f"{_digest(key_text.encode('utf-8', 'surrogateescape'))}.pkl"
+    if not refresh:
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if cached["manifest"] == manifest and time.time() - cached["written"] < ttl:
+                return cached["result"]
+        except Exception:
+            pass  # missing, stale format or unreadable: rescan
+
+    result = compute()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump({"manifest": manifest, "written": time.time(), "result": result}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+        _evict_old_cache_files()
+    except OSError:
+        pass
+    return result
+
+
+def _disk_cached(dir_path: str, key_text: str, compute: Callable[[], Any], refresh: bool = False) -> Any:
+    """
+    Return compute() memoized on disk for one root (see _memo_file).
+    A cached result is reused for up to CACHE_TTL while the root's manifest (its
+    own mtime/size and the mtimes of its direct entries) is unchanged. Deeper
+    changes can still be served stale until then — callers pass refresh=True to
+    recompute and overwrite the entry.
+    """
+    try:
+        st = os.stat(dir_path)
+    except OSError:
+        return compute()
+    return _memo_file(key_text, _root_manifest(dir_path, st), compute, CACHE_TTL, refresh)
+
+
+def cached_run(roots: List[str], key_text: str, compute: Callable[[], Any], ttl: float,
+               refresh: bool = False) -> Any:
+    """
+    Memoize a whole multi-root run: compute() is skipped when a result for the same
+    key_text (the caller's options) was written less than ttl seconds ago and every
+    root's manifest is unchanged. Any unreadable root, or ttl <= 0, just computes;
+    refresh=True computes and rewrites the entry.
+    """
+    if ttl <= 0:
+        return compute()
+    manifests = []
+    for root in roots:
+        try:
+            manifests.append(_root_manifest(root, os.stat(root)))
+        except OSError:
+            return compute()
+    key_text = "run|" + "\0".join(roots) + "|" + key_text
+    return _memo_file(key_text, "|".join(manifests), compute, ttl, refresh)
+
+
+class DuCache:
+    """
+    Per-folder sizes persisted in SQLite (CACHE_DIR/du.sqlite), for scan_tree.
+    Each row holds one folder's own file bytes (hard-linked files kept aside, so the
+    walk can still count each inode once) plus its subfolder list, keyed by path
+    and checked against the folder's st_mtime_ns/st_ino. An unchanged folder is then
+    answered with one stat instead of a listing; its subfolders are still checked one
+    by one, so entries added or removed anywhere below are picked up. Files that only
+    grow in place don't touch their folder's mtime, so rows also expire after 'ttl'
+    seconds (CACHE_TTL); refresh=True re-lists everything now (rows are still rewritten).
+    Lookups are safe from scan_tree's worker threads; new rows are written on close().
+    Folders are stat'ed through symlinks: the walk never enters a symlinked folder, but
+    a root given as one (/tmp, /var) must be keyed on its target's mtime.
+    """
+
+    PATH = CACHE_DIR / "du.sqlite"
+    SCHEMA_VERSION = 3  # bump when the row layout changes; older tables are dropped
+
+    def __init__(self, refresh: bool = False, path: Optional[Path] = None, ttl: float = CACHE_TTL):
+        path = path or self.PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.refresh = refresh
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[bytes, int, int, int, int, bytes, float]] = []
+        self._db = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            with self._db:
+                self._db.execute("DROP TABLE IF EXISTS dirs")
+                self._db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS dirs (path BLOB PRIMARY KEY, mtime_ns INT, ino INT,"
+            " size INT, ctime_ns INT, subdirs BLOB, written REAL)"
+        )
+
+    def lookup(self, path: str, st: os.stat_result
+               ) -> Optional[Tuple[int, List[Tuple[str, int, int]], List[Tuple[int, int, int, str]]]]:
+        """
+        (own_bytes, [(subdir, alloc_bytes, dev)], [(dev, ino, alloc_bytes, path)] of
+        hard-linked files) if path (stat'ed as 'st') is unchanged since stored less than
+        ttl ago, else None.
+        """
+        if self.refresh:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT mtime_ns, ino, size, subdirs, written FROM dirs WHERE path = ?", (os.fsencode(path),)
+            ).fetchone()
+        if row is None or row[0] != st.st_mtime_ns or row[1] != st.st_ino or time.time() - row[4] >= self.ttl:
+            return None
+        subdirs, linked = pickle.loads(row[3])
+        return row[2], subdirs, linked
+
+    def store(self, path: str, st: os.stat_result, own: int, subdirs: List[Tuple[str, int, int]],
+              linked: List[Tuple[int, int, int, str]]) -> None:
+        """
+        Queue path's freshly listed sizes for writing on close(). 'st' must be taken
+        before the listing: a folder changed mid-listing then fails its next lookup
+        instead of having the old listing saved under its new mtime.
+        """
+        row = (os.fsencode(path), st.st_mtime_ns, st.st_ino, own, st.st_ctime_ns,
+               pickle.dumps((subdirs, linked), protocol=pickle.HIGHEST_PROTOCOL), time.time())
+        with self._lock:
+            self._pending.append(row)
+
+    def close(self) -> None:
+        """Write queued rows in one transaction and close the database."""
+        with self._lock:
+            try:
+                with self._db:
+                    self._db.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?, ?, ?)", self._pending)
+            except sqlite3.Error:
+                pass  # cache is best-effort
+            self._pending = []
+            self._db.close()
+
+    def __enter__(self) -> "DuCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def cached_du_list(dir_path: str, depth: int, engine: str = "native", refresh: bool = False,
+                   on_dir: Optional[DirCallback] = None, workers: int = SCAN_WORKERS) -> List[Tuple[int, str]]:
+    """
+    du_list backed by a cache: the native engine reuses unchanged folders from DuCache
+    (refresh=True re-lists them all); the 'du' engine is memoized per (root, depth)
+    with _disk_cached (refresh=True rewrites it). Falls back to an uncached du_list if
+    the cache can't be opened.
+    on_dir fires for every folder the native walk visits, listed or answered from DuCache.
+    """
+    if engine == "du":
+        return _disk_cached(dir_path, f"{dir_path}|{depth}|{engine}", lambda: du_list(dir_path, depth, engine), refresh)
+    try:
+        du_cache = DuCache(refresh=refresh)
+    except (OSError, sqlite3.Error):
+        return du_list(dir_path, depth, engine, on_dir, workers)
+    with du_cache:
+        return scan_tree(dir_path, depth, workers=workers, du_cache=du_cache, on_dir=on_dir)[0]
+
+
+def cached_find_big_files(root: str, min_gb: float, top: int, refresh: bool = False) -> List[Tuple[int, str]]:
+    """find_big_files memoized on disk per (root, threshold, top); see _disk_cached."""
+    return _disk_cached(root, f"{root}|bigfiles>={min_gb}|top={top}", lambda: find_big_files(root, min_gb, top),
+                        refresh)
+
+
+def cached_scan_tree(dir_path: str, depth: int, min_file_bytes: Optional[int], top: int,
+                     on_file: Optional[FileCallback] = None, type_min_bytes: Optional[int] = None,
+                     on_dir: Optional[DirCallback] = None, workers: int = SCAN_WORKERS,
+                     refresh: bool = False) -> ScanResult:
+    """
+    scan_tree memoized on disk per (root, depth, file threshold, top, type threshold);
+    see _disk_cached (refresh=True rescans and overwrites the entry).
+    on_file/on_dir only fire when the tree is actually walked (cache miss or refresh).
+    """
+    key = f"{dir_path}|{depth}|files>={min_file_bytes}|top={top}|types>={type_min_bytes}"
+    return _disk_cached(dir_path, key, lambda: scan_tree(dir_path, depth, min_file_bytes, top, on_file,
+                                                         type_min_bytes, workers, on_dir=on_dir), refresh)
+
+
 def leaf_only(entries: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
     """
     Keep only 'leaf' paths: if a parent and a child are present, drop the parent.
     Avoids duplicate-looking rows where parent size includes the child’s size.
+    Paths are sorted once; everything under "path/" is then a contiguous run, so
+    one bisect per entry tells whether it has a descendant (O(N log N)).
+    Paths are compared as bytes (os.fsencode, once each): bytes order and prefixes
+    match str's for UTF-8, and bytes compares skip str's per-kind dispatch.
     """
+    encoded = [(size, path, os.fsencode(path)) for size, path in entries]
+    paths = sorted(path_b for _, _, path_b in encoded)
     keep: List[Tuple[int, str]] = []
-    for size, path in sorted(entries, key=lambda x: len(x[1]), reverse=True):
-        is_parent = any(kp.startswith(path.rstrip("/") + "/") for _, kp in keep)
-        if not is_parent:
+    for size, path, path_b in encoded:
+        prefix = path_b.rstrip(b"/") + b"/"
+        # "/" or "dir/" is its own prefix: look past the entry itself for a descendant
+        i = bisect_right(paths, prefix) if prefix == path_b else bisect_left(paths, prefix)
+        if i == len(paths) or not paths[i].startswith(prefix):
             keep.append((size, path))
     return sorted(keep, key=lambda x: x[0], reverse=True)
 
 
-def find_big_files(root: str, min_gb: float, top: int) -> List[Tuple[int, str]]:
+def _find_files_cmd(root: str, min_bytes: int) -> list[str]:
+    """
+    'find' command listing regular files of at least min_bytes under root, NUL-separated
+    (so any byte but NUL may appear in a path).
+      - -xdev stays on root's volume (like du -x)
+      - PRUNE subtrees are pruned in place (-prune) so find never descends into them
+      - -size +Nc is an exact byte threshold (find's G/M units round up to whole units)
     """
-    Find up to 'top' largest files under 'root' with size >= min_gb.
-    Uses:
-      - find <root> -type f -size +{min_gb}G
-      - stat -f "%z %N" <files...>
-    Returns list of (size_bytes, path), sorted desc by size.
-    """
-    out = run(["find", root, "-type", "f", "-size", f"+{min_gb}G"])
-    files = [f for f in out.splitlines() if f.strip()]
-    entries: List[Tuple[int, str]] = []
-    if not files:
-        return entries
-
-    # batch to avoid excessively long arg lists
-    chunk = 200
-    for i in range(0, len(files), chunk):
-        group = files[i:i+chunk]
-        cmd = ["stat", "-f", "%z %N"] + group  # %z size (bytes), %N filename
-        for line in run(cmd).splitlines():
-            parts = line.split(" ", 1)
-            if len(parts) != 2:
+    prune: list[str] = []
+    for p in sorted(_prune_for(root)):
+        prune += ["-o", "-path", p] if prune else ["-path", p]
+    return ["find", root, "-xdev", "(", *prune, ")", "-prune", "-o",
+            "-type", "f", "-size", f"+{max(0, min_bytes - 1)}c", "-print0"]
+
+
+def find_big_files_iter(root: str, min_gb: float, top: int) -> Iterator[Tuple[int, str, Optional[Tuple[int, str]]]]:
+    """
+    Stream the running top-'top' largest files under 'root' using >= min_gb on disk
+    while the tree is still being walked, instead of waiting for the whole tree.
+    Yields (size_bytes, path, evicted) each time a file enters the top-N, where
+    'evicted' is the (size_bytes, path) it pushed out (None while the heap fills).
+    Folders are listed with list_dir(), so sizes come with the listing (one
+    getattrlistbulk call, or os.scandir's cached stat) — no second stat per file.
+    Stays on root's volume and skips PRUNE subtrees, like the folder walk; a file with
+    several hard links is listed once.
+    """
+    min_bytes = int(min_gb * GIB)
+    try:
+        root_dev = os.stat(root).st_dev
+    except OSError:
+        return
+    prune = _prune_for(root)
+    heap: List[Tuple[int, str]] = []
+    seen_links = set()
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            entries = list_dir(path, path == root)  # only the root may be a symlink
+        except OSError:
+            continue
+        for child, is_dir, size, dev, link_ino in entries:
+            if is_dir:
+                if dev == root_dev and child not in prune:
+                    stack.append(child)
                 continue
-            try:
-                size = int(parts[0])
-            except ValueError:
+            if size < min_bytes:
                 continue
-            entries.append((size, parts[1]))
-
-    return sorted(entries, key=lambda x: x[0], reverse=True)[:top]
+            if link_ino:
+                if (dev, link_ino) in seen_links:
+                    continue
+                seen_links.add((dev, link_ino))
+            entry = (size, child)
+            if len(heap) < top:
+                heapq.heappush(heap, entry)
+                yield entry + (None,)
+            elif entry > heap[0]:
+                evicted = heapq.heappushpop(heap, entry)
+                yield entry + (evicted,)
 
 
-def sample_files_for_types(root: str, min_mb: int) -> List[Tuple[int, str]]:
+def find_big_files(root: str, min_gb: float, top: int) -> List[Tuple[int, str]]:
     """
-    Sample files >= min_mb megabytes under 'root' for file-type aggregation.
-    Returns list of (size_bytes, path).
+    Find up to 'top' largest files under 'root' using >= min_gb on disk
+    (see find_big_files_iter). Returns list of (size_bytes, path), sorted desc by size.
     """
-    out = run(["find", root, "-type", "f", "-size", f"+{min_mb}M"])
-    files = [f for f in out.splitlines() if f.strip()]
-    entries: List[Tuple[int, str]] = []
-    if not files:
-        return entries
+    return heapq.nlargest(top, ((size, path) for size, path, _ in find_big_files_iter(root, min_gb, top)))
 
-    chunk = 200
-    for i in range(0, len(files), chunk):
-        group = files[i:i+chunk]
-        cmd = ["stat", "-f", "%z %N"] + group
-        for line in run(cmd).splitlines():
-            parts = line.split(" ", 1)
-            if len(parts) != 2:
-                continue
-            try:
-                size = int(parts[0])
-            except ValueError:
-                continue
-            entries.append((size, parts[1]))
-    return entries
+
+def sample_files_for_types(root: str, min_mb: int) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (size_bytes, path) for files >= min_mb megabytes (on disk) under 'root',
+    for file-type aggregation. find's NUL-separated paths are lstat'ed in-process as
+    they arrive (no second 'stat' process), so nothing is held per file but the
+    (st_dev, st_ino) of hard-linked ones, which are counted once like the native walk —
+    feed it straight to filetype_totals. The threshold is re-checked on the allocated
+    size (st_blocks * 512; find's -size looks at the logical size).
+    """
+    min_bytes = min_mb * 1024 * 1024
+    seen_links = set()
+    proc = subprocess.Popen(_find_files_cmd(root, min_bytes), stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, bufsize=1 << 20)
+    try:
+        tail = b""
+        while True:
+            chunk = proc.stdout.read1(64 * 1024)
+            if not chunk:
+                break
+            *records, tail = (tail + chunk).split(b"\0")
+            for rec in records:
+                if not rec:
+                    continue
+                try:
+                    st = os.lstat(rec)
+                except OSError:
+                    continue  # vanished since find listed it
+                size = st.st_blocks * 512
+                if size < min_bytes:
+                    continue
+                if st.st_nlink > 1:
+                    if (st.st_dev, st.st_ino) in seen_links:
+                        continue
+                    seen_links.add((st.st_dev, st.st_ino))
+                yield size, os.fsdecode(rec)
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()  # consumer stopped early
+        proc.wait()
 
 
 # ---------- Utilities ----------
 
+GIB = 1 << 30  # bytes per GiB
+
+
 def human_gb(bytes_val: int) -> float:
     """Convert bytes → gigabytes (GiB)."""
-    return bytes_val / (1024 ** 3)
+    return bytes_val / GIB
 
 
 def accumulate_root_totals(per_root_pairs: Dict[str, list[tuple[int, str]]]) -> Dict[str, int]:
     """
     Given a mapping {root: [(size_bytes, path), ...]} compute approximate totals per root.
     """
-    totals: Dict[str, int] = defaultdict(int)
-    for root, pairs in per_root_pairs.items():
-        totals[root] = sum(size for size, _ in pairs)
-    return totals
+    first = itemgetter(0)
+    return {root: sum(map(first, pairs)) for root, pairs in per_root_pairs.items()}  # C-level sum, no genexpr
+
+
+def _file_ext(path: str) -> str:
+    """
+    Lowercased extension of path's basename, or "(no-ext)". Two str.rpartition calls:
+    same result as os.path.splitext (dotfiles have none) at half the cost.
+    """
+    stem, _, ext = path.rpartition("/")[2].rpartition(".")
+    return "." + ext.lower() if stem.lstrip(".") else "(no-ext)"
 
 
-def filetype_totals(sampled_files: list[tuple[int, str]]) -> Counter:
+def filetype_totals(sampled_files: Iterable[Tuple[int, str]]) -> Dict[str, int]:
     """
     Aggregate sampled files by extension to build a size-by-type distribution.
+    Single pass over a plain dict (see _file_ext; no Path per file).
     """
-    c: Counter = Counter()
+    totals: Dict[str, int] = {}
+    get = totals.get
     for size, p in sampled_files:
-        ext = Path(p).suffix.lower()
-        if not ext:
-            ext = "(no-ext)"
-        c[ext] += size
-    return c
+        ext = _file_ext(p)
+        totals[ext] = get(ext, 0) + size
+    return totals
 
 
 # ---------- Chart helpers (optional) ----------
 
+# Matplotlib is optional and costs ~0.5 s to import, so it is imported on the first
+# chart only (see _pyplot) — importing storage_utils stays cheap for the GUI and CLI.
+_plt: Any = None  # matplotlib.pyplot once imported, False if unavailable
+_plt_lock = threading.Lock()
+
+
+def _pyplot() -> Any:
+    """matplotlib.pyplot on the Agg backend (charts are only saved to PNG), or None if not installed."""
+    global _plt
+    with _plt_lock:
+        if _plt is None:
+            try:
+                import matplotlib
+                matplotlib.use("Agg")
+                import matplotlib.pyplot as plt
+                _plt = plt
+            except ImportError:
+                _plt = False
+    return _plt or None
+
+
 def save_bar_chart(title: str, labels, values, out_path: Path, xlabel: str = "GB", ylabel: str = "") -> None:
     """Save a simple horizontal bar chart (one plot per figure)."""
-    try:
-        import matplotlib.pyplot as plt  # local import avoids global state/scoping issues
-    except Exception:
-        return  # matplotlib not installed or unusable; silently skip
+    plt = _pyplot()
+    if plt is None:
+        return  # matplotlib not installed; silently skip
 
     plt.figure()
     short = [l if len(l) <= 60 else ("…" + l[-57:]) for l in labels]
@@ -179,16 +1011,14 @@ def save_bar_chart(title: str, labels, values, out_path: Path, xlabel: str = "GB
     if ylabel:
         plt.ylabel(ylabel)
     plt.title(title)
-    plt.tight_layout()
-    plt.savefig(out_path)
+    plt.savefig(out_path, bbox_inches="tight", dpi=100)  # cheaper than a tight_layout() pass
     plt.close()
 
 
 def save_pie_chart(title: str, labels, values, out_path: Path) -> None:
     """Save a simple pie chart (groups beyond ~10 slices into 'Other')."""
-    try:
-        import matplotlib.pyplot as plt
-    except Exception:
+    plt = _pyplot()
+    if plt is None:
         return
 
     total = sum(values) if values else 0
@@ -205,12 +1035,12 @@ def save_pie_chart(title: str, labels, values, out_path: Path) -> None:
     if other > 0:
         top.append(("Other", other))
 
-    labels2 = [p[0] for p in top]
+    # percentages baked into the labels (no per-wedge autopct callback/text)
+    labels2 = [f"{lab} ({val / total * 100:.1f}%)" for lab, val in top]
     values2 = [p[1] for p in top]
 
     plt.figure()
-    plt.pie(values2, labels=labels2, autopct=lambda p: f"{p:.1f}%")
+    plt.pie(values2, labels=labels2)
     plt.title(title)
-    plt.tight_layout()
-    plt.savefig(out_path)
+    plt.savefig(out_path, bbox_inches="tight", dpi=100)  # cheaper than a tight_layout() pass
     plt.close()
\ No newline at end of file